@@ -1,4 +1,4 @@
-from base import OptionsBaseException
+from .base import OptionsBaseException
 
 
 class Position:
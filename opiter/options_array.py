@@ -1,8 +1,9 @@
-from base import OptionsBaseException
-from options_tree_elements import OptionsTreeElement
-from node_info import NodeInfo, Position
-from options_node import OptionsNode, OptionsNodeException
-from copy import deepcopy
+from .base import OptionsBaseException
+from .options_tree_elements import OptionsTreeElement, attach_within_tree
+from .node_info import NodeInfo, Position
+from .options_node import OptionsNode, OptionsNodeException, \
+    create_name_formatter, intern_name
+from copy import copy, deepcopy
 from warnings import warn
 
 
@@ -76,6 +77,8 @@ class OptionsArray(OptionsTreeElement):
     """
     A sequence of OptionsNodes.
     """
+    # node names gathered by update_node_info, if it is running
+    _node_names = None
 
     def __init__(self, array_name, elements, names=None, name_format='{}',
                  tags=[], list_hooks=[], dict_hooks=[], item_hooks=[]):
@@ -107,7 +110,7 @@ class OptionsArray(OptionsTreeElement):
         OptionsTreeElement.__init__(self, list_hooks=list_hooks,
                                     dict_hooks=dict_hooks,
                                     item_hooks=item_hooks)
-        self.name = array_name
+        self.name = intern_name(array_name)
         self.tags = tags
         self.nodes = []
         
@@ -115,6 +118,12 @@ class OptionsArray(OptionsTreeElement):
             arg_list = zip(names, elements)
         else:
             arg_list = zip(elements)
+
+        # work out how to apply name_format before looping
+        try:
+            name_format = create_name_formatter(name_format)
+        except OptionsNodeException as e:
+            raise OptionsArrayException(str(e))
         
         # instantiate and record OptionsNodes
         for args in arg_list:
@@ -173,28 +182,41 @@ class OptionsArray(OptionsTreeElement):
             el.multiply_attach(tree)
 
 
-    def attach(self, tree):
-        """
-        Appends a copy of each root node in the tree argument (or
-        whichever elements get traversed during iteration) to a
-        corresponding leaf node in the present tree.  Returns the
-        depleted source tree.
-        """
-        # delegate to each node
+    def _attach(self, tree):
+        # see OptionsTreeElement.attach.  Delegate to each node.
         for el in self:
-            tree = el.attach(tree)
+            tree = attach_within_tree(el, tree)
         return tree
 
 
     def donate_copy(self, acceptor):
+        acceptor = self._donate_first_node(acceptor)
+        # also return (a copy of) the depleted array
+        return acceptor, self[1:]
+
+
+    def _donate_copy(self, acceptor):
+        # Used during attachment instead of donate_copy.  The depleted
+        # array shares its nodes with the present array rather than
+        # copying them, since it only serves as the source of further
+        # donations, each of which copies its node before giving it
+        # away.  An overriding donate_copy takes precedence.
+        if self.donate_copy.im_func is not OptionsArray.donate_copy.im_func:
+            return self.donate_copy(acceptor)
+        acceptor = self._donate_first_node(acceptor)
+        remainder = copy(self)
+        remainder.nodes = self.nodes[1:]
+        return acceptor, remainder
+
+
+    def _donate_first_node(self, acceptor):
         one_node_array = deepcopy(self[0])
         one_node_array.update_node_info()
         if acceptor:
-            acceptor.attach(one_node_array)
+            attach_within_tree(acceptor, one_node_array)
         else:
             acceptor = one_node_array
-        # also return (a copy of) the depleted array
-        return acceptor, self[1:]
+        return acceptor
 
 
     def count_leaves(self):
@@ -214,12 +236,19 @@ class OptionsArray(OptionsTreeElement):
         Updates the nodes with node information appropriate to an
         OptionsArray.
         """
-        for i, node in enumerate(self.nodes):
-            try:
-                node.update_node_info(self.create_node_info(i))
-            except:
-                print node
-                raise
+        # gather the node names once; the resulting list is shared
+        # by all the nodes' node info rather than rebuilt for each.
+        # It is kept on the array for create_node_info to pick up.
+        self._node_names = [str(node) for node in self.nodes]
+        try:
+            for i, node in enumerate(self.nodes):
+                try:
+                    node.update_node_info(self.create_node_info(i))
+                except:
+                    print node
+                    raise
+        finally:
+            del self._node_names
 
         
     def create_node_info(self, index):
@@ -227,7 +256,9 @@ class OptionsArray(OptionsTreeElement):
         Overrideable factory method, used by
         OptionsArray.update_node_info.
         """
-        node_names = [str(node) for node in self.nodes]
+        node_names = self._node_names
+        if node_names is None:
+            node_names = [str(node) for node in self.nodes]
         return ArrayNodeInfo(self.name, node_names, index, tags=self.tags)
 
     
@@ -370,20 +401,17 @@ class OptionsArrayFactory:
 
     @staticmethod
     def apply_formatting(index_format, index):
-        try:
-            # try applying fmt as a function
-            return index_format(index)
-        except TypeError:
-            # apply fmt as a format string
-            return index_format.format(index)
+        # index_format may be a function or a format string
+        return create_name_formatter(index_format)(index)
     
     def __call__(self, array_name, elements):
+        # the array part of each node name is the same throughout
+        array_prefix = self.apply_formatting(
+            self.array_index_format, self.array_index)
+        node_index_format = create_name_formatter(self.node_index_format)
         nodes = []
         for node_index, el in enumerate(elements):
-            node_name = self.apply_formatting(
-                self.array_index_format, self.array_index)
-            node_name += self.apply_formatting(
-                self.node_index_format, node_index)
+            node_name = array_prefix + node_index_format(node_index)
             nodes.append(
                 OptionsNode(node_name, el, node_key=array_name))
 
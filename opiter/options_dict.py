@@ -1,6 +1,6 @@
-from base import OptionsBaseException
-from node_info import NodeInfoException
-from formatters import SimpleFormatter, TreeFormatter
+from .base import OptionsBaseException
+from .node_info import NodeInfoException
+from .formatters import SimpleFormatter, TreeFormatter
 from types import FunctionType
 from string import Template
 from copy import deepcopy
@@ -11,6 +11,10 @@ from pickle import dumps, PicklingError
 
 MissingDependencyExceptions = (KeyError, AttributeError, NodeInfoException)
 
+# the compiled placeholder pattern used by string.Template, reused
+# directly for template expansion
+_TEMPLATE_PATTERN = Template.pattern
+
 
 class OptionsDictException(OptionsBaseException):
     pass
@@ -86,8 +90,21 @@ class OptionsDict(dict):
         'donate_copy', 'indent', 'create_node_info_formatter', 
         'expand_template_string', 'get_position', 'get_node_info', 
         'get_string', 'set_node_info',  'transform_items', 'update']
+
+    # hidden attributes are stored in slots rather than a per-instance
+    # __dict__.  Note that dict.__setattr__ has to be used to set them
+    # directly, since OptionsDict.__setattr__ sets items.
+    __slots__ = ('_node_info', '_dependent_keys')
+
+    def __new__(Class, *args, **kwargs):
+        # set up the record of dependent items here rather than in
+        # __init__ so that it is also present during copying and
+        # unpickling, when __init__ is bypassed
+        obj = dict.__new__(Class)
+        dict.__setattr__(obj, '_dependent_keys', set())
+        return obj
     
-    def __init__(self, items={}):
+    def __init__(self, items=None):
         """
         Returns an OptionsDict with no node information.  The items
         argument can be more than just key-value pairs; see the update
@@ -98,7 +115,8 @@ class OptionsDict(dict):
         # dependent items from possibly referencing the component
         # before it exists.
         self._node_info = []
-        self.update(items)
+        if items is not None:
+            self.update(items)
 
     
     def update(self, items):
@@ -110,14 +128,11 @@ class OptionsDict(dict):
         methods will go on to become conventional and dependent items,
         respectively.
         """
-        default_err = OptionsDictException(
-            "\nArgument must be a dict, an iterable of dependent items "+\
-            "(i.e. functions),\nor a class with attributes and/or methods.")
         for strategy in [self._update_from_dict,
                          self._update_from_dependent_items,
                          self._update_from_class]:
             try:
-                strategy(items, default_err)
+                strategy(items)
                 return
             except (AttributeError, TypeError):
                 # tolerate certain exceptions by moving onto the next
@@ -125,10 +140,13 @@ class OptionsDict(dict):
                 pass
 
         # if we've looped through all the strategies and come to the end, 
-        # the argument was incompatible
-        raise default_err
+        # the argument was incompatible.  (The exception is only
+        # created now, as this is the exceptional case.)
+        raise OptionsDictException(
+            "\nArgument must be a dict, an iterable of dependent items "+\
+            "(i.e. functions),\nor a class with attributes and/or methods.")
+
 
-    
     def transform_items(self, function, recursive=True):
         """
         Applies a function, which takes arguments of a dictionary and a
@@ -281,8 +299,34 @@ class OptionsDict(dict):
         corresponding values in the OptionsDict.  More than one loop
         will be needed if the placeholders are nested.
         """
+        # the string form of each item is worked out at most once,
+        # however many times it appears and however many loops are
+        # made.  Items that are missing are recorded as None.
+        rendered = {}
+        
+        def substitute(match):
+            # mimics Template.safe_substitute, leaving unrecognised
+            # placeholders untouched
+            key = match.group('named') or match.group('braced')
+            if key is not None:
+                if key not in rendered:
+                    try:
+                        rendered[key] = '%s' % (self[key],)
+                    except KeyError:
+                        rendered[key] = None
+                value = rendered[key]
+                return match.group() if value is None else value
+            if match.group('escaped') is not None:
+                return Template.delimiter
+            return match.group()
+
         for i in range(loops):
-            buffer_string = Template(buffer_string).safe_substitute(self)
+            new_string = _TEMPLATE_PATTERN.sub(substitute, buffer_string)
+            # further loops would make no difference once the string
+            # stops changing
+            if new_string == buffer_string:
+                break
+            buffer_string = new_string
         # this next line will flag any unexpanded placeholders as
         # KeyErrors
         Template(buffer_string).substitute({})
@@ -295,31 +339,43 @@ class OptionsDict(dict):
         return acceptor, []
 
     
-    def _update_from_dict(self, other, default_error):
+    def _update_from_dict(self, other):
         # update OptionsDict attributes
         if isinstance(other, OptionsDict):
             self._node_info += other._node_info
             # if len(self._node_info) > 1: raise Exception
         # now check item names and pass to superclass
-        for k in other.keys():
+        keys = other.keys()
+        for k in keys:
             self._check_new_item_name(k)
         dict.update(self, other)
+        if isinstance(other, OptionsDict):
+            # the other OptionsDict already knows which of its items
+            # are dependent, so merge its record rather than inspecting
+            # each item again.  (An OptionsDict updated from itself
+            # keeps its record as it is.)
+            if other is not self:
+                self._dependent_keys.difference_update(keys)
+                self._dependent_keys.update(other._dependent_keys)
+        else:
+            for k in keys:
+                self._register_item(k, dict.__getitem__(self, k))
 
         
-    def _update_from_dependent_items(self, functions, default_error):
+    def _update_from_dependent_items(self, functions):
         for func in functions:
             if not isinstance(func, FunctionType):
-                raise default_error
+                raise TypeError("{} is not a function".format(func))
             varnames = func.func_code.co_varnames
             self._check_new_item_name(func.__name__)
             self[func.__name__] = func
 
             
-    def _update_from_class(self, basis_class, default_error):
+    def _update_from_class(self, basis_class):
         # recurse through the basis_class' superclasses first
         if basis_class.__bases__:
             for b in basis_class.__bases__:
-                self._update_from_class(b, default_error)
+                self._update_from_class(b)
 
         # ignore magic/hidden attributes, which are prefixed with
         # a double underscore
@@ -330,6 +386,15 @@ class OptionsDict(dict):
         self.update(items)
 
         
+    def _register_item(self, key, value):
+        # keeps track of which items are dependent so that lookups
+        # need not inspect the type of every value
+        if type(value) is FunctionType:
+            self._dependent_keys.add(key)
+        else:
+            self._dependent_keys.discard(key)
+
+        
     def _check_new_item_name(self, name):
         if name[0] == '_':
             raise OptionsDictException(
@@ -351,7 +416,10 @@ class OptionsDict(dict):
         return dict.__repr__(self) + repr(self._node_info)
 
     def __iter__(self):
-        yield self
+        # iterating over an OptionsDict yields the OptionsDict itself,
+        # so that it can stand in for a collection of them.  Use keys()
+        # to iterate over the keys.
+        return iter((self,))
 
     def __getattr__(self, name):
         try:
@@ -361,34 +429,97 @@ class OptionsDict(dict):
 
     def __setattr__(self, name, value):
         if name in self.mutable_attributes:
-            self.__dict__[name] = value
+            dict.__setattr__(self, name, value)
         else:
             self._check_new_item_name(name)
             self[name] = value
         
     def __eq__(self, other):
-        result = isinstance(other, OptionsDict)
-        if result:
-            result *= self._node_info == other._node_info
-            result *= dict.__eq__(self, other)
-        return result
+        # make the cheapest comparisons first so that unequal
+        # OptionsDicts can be told apart without comparing every item
+        if not isinstance(other, OptionsDict):
+            return False
+        if len(self) != len(other):
+            return False
+        if self._node_info != other._node_info:
+            return False
+        return dict.__eq__(self, other)
 
     def __ne__(self, other):
         return not self==other
     
     def __getitem__(self, key):
-        try:
-            value = dict.__getitem__(self, key)
-        except:
-            raise
-        # recurse until the return value is no longer a function
-        if isinstance(value, FunctionType):
+        value = dict.__getitem__(self, key)
+        if key in self._dependent_keys:
             # dependent item
-            return value(self)
+            result = value(self)
+            # a dependent item may itself return a function, so keep
+            # evaluating until the result is no longer one
+            while type(result) is FunctionType:
+                result = result(self)
+            return result
         else:
             # normal item
             return value
 
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._register_item(key, value)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._dependent_keys.discard(key)
+
+    def clear(self):
+        dict.clear(self)
+        self._dependent_keys.clear()
+
+    def pop(self, key, *args):
+        self._dependent_keys.discard(key)
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self._dependent_keys.discard(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        value = dict.setdefault(self, key, default)
+        self._register_item(key, value)
+        return value
+
+    def __getstate__(self):
+        # gather the slots along with any attributes that a subclass
+        # keeps in its __dict__
+        try:
+            state = self.__dict__.copy()
+        except AttributeError:
+            state = {}
+        state['_node_info'] = self._node_info
+        # the record of dependent items must not be shared, otherwise
+        # a shallow copy would mutate the original's record
+        state['_dependent_keys'] = set(self._dependent_keys)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            dict.__setattr__(self, name, value)
+
+    def __deepcopy__(self, memo):
+        # NodeInfo objects are replaced rather than modified, so the
+        # copy can share them with the original.  This saves copying
+        # the node names of every collection each time a tree is
+        # collapsed.
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        state = self.__getstate__()
+        node_info = state.pop('_node_info')
+        state = deepcopy(state, memo)
+        state['_node_info'] = list(node_info)
+        result.__setstate__(state)
+        for k, v in dict.iteritems(self):
+            dict.__setitem__(result, deepcopy(k, memo), deepcopy(v, memo))
+        return result
 
 def dict_key_pairs(this_dict, key=None, recursive=True):
     """
@@ -499,19 +630,30 @@ class Sequence:
             func(target_dict, key)
 
 
-class CallableOption:
+class CallableOption(object):
     """
     Because the OptionsDict works by evaluating all function objects
     recursively, it is not able to return other functions specified by
     the client unless these are wrapped as callable objects.  This class
     provides such a wrapper.
     """
+    # there may be many of these, so do without a per-instance __dict__
+    __slots__ = ('function',)
+    
     def __init__(self, function):
         self.function = function
         
     def __call__(self, *args, **kwargs):
         return self.function(*args, **kwargs)
 
+    # slotted objects need these in order to be pickled with the
+    # older protocols
+    def __getstate__(self):
+        return self.function
+
+    def __setstate__(self, function):
+        self.function = function
+
 
 class Lookup:
     """
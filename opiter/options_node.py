@@ -1,7 +1,7 @@
-from options_tree_elements import OptionsTreeElement, \
-    OptionsTreeElementException
-from node_info import NodeInfo, Position
-from options_dict import OptionsDict
+from .options_tree_elements import OptionsTreeElement, \
+    OptionsTreeElementException, attach_within_tree
+from .node_info import NodeInfo, Position
+from .options_dict import OptionsDict
 from copy import deepcopy
 from warnings import warn
 
@@ -10,6 +10,35 @@ class OptionsNodeException(OptionsTreeElementException):
     pass
 
 
+def create_name_formatter(name_format):
+    """
+    Returns a one-argument function that converts a value to a node
+    name.  name_format may be such a function already, in which case
+    it is returned as is, or a format string.  Resolving name_format
+    once in this way saves working it out afresh for every node.
+    A format string is applied through its bound format method.
+    """
+    if callable(name_format):
+        return name_format
+    try:
+        return name_format.format
+    except AttributeError:
+        raise OptionsNodeException(
+            "name_format must be a callable or a format string; is {}".\
+            format(name_format))
+
+
+def intern_name(name):
+    """
+    Interns name if it is a plain string.  Names are drawn from a
+    small vocabulary and compared often (e.g. when node info is
+    compared), and interned strings can be compared by identity.
+    """
+    if type(name) is str:
+        return intern(name)
+    return name
+
+
 class OrphanNodeInfo(NodeInfo):
     """
     Describes a node which is not part of any collection.
@@ -122,20 +151,7 @@ class OptionsNode(OptionsTreeElement):
             name_src = arg
             
         # convert to a string with the help of name_format
-        try:
-            self.name = name_format(name_src)
-            return
-        except TypeError:
-            pass
-
-        # if name_format fails as a function, try treating it as a
-        # format string
-        try:
-            self.name = name_format.format(name_src)
-        except AttributeError:
-            raise OptionsNodeException(
-                "name_format must be a callable or a format string; is {}".\
-                format(name_format))
+        self.name = intern_name(create_name_formatter(name_format)(name_src))
             
 
     def update_options_dict_general(self, arg, node_key):
@@ -167,7 +183,7 @@ class OptionsNode(OptionsTreeElement):
                 self.options_dict.update({node_key: arg})
 
         
-    def create_options_dict(self, items={}):
+    def create_options_dict(self, items=None):
         """
         Overrideable factory method, used by OptionsNode.set_options_dict.
         """
@@ -223,13 +239,8 @@ class OptionsNode(OptionsTreeElement):
             self.child.update_node_info()
 
             
-    def attach(self, tree):
-        """
-        Appends a copy of each root node in the tree argument (or
-        whichever elements get traversed during iteration) to a
-        corresponding leaf node in the present tree.  Returns the
-        depleted source tree.
-        """
+    def _attach(self, tree):
+        # see OptionsTreeElement.attach
         if not tree:
             # no more elements to attach, so exit early
             return None
@@ -239,8 +250,11 @@ class OptionsNode(OptionsTreeElement):
             # rest to the client.
             try:
                 # polymorphic implementation, needed for handling
-                # embedded node info correctly
-                self.child, remainder = tree.donate_copy(self.child)
+                # embedded node info correctly.  Arrays provide a
+                # variant that avoids copying their remaining nodes.
+                donate_copy = getattr(tree, '_donate_copy', None) or \
+                    tree.donate_copy
+                self.child, remainder = donate_copy(self.child)
                 self.child.update_node_info()
                 return remainder
             except AttributeError:
@@ -249,13 +263,13 @@ class OptionsNode(OptionsTreeElement):
                 return tree[1:]
         else:
             # keep going
-            return self.child.attach(tree)
+            return attach_within_tree(self.child, tree)
 
 
     def donate_copy(self, acceptor):
         node_copy = deepcopy(self)
         if acceptor:
-            acceptor.attach(node_copy)
+            attach_within_tree(acceptor, node_copy)
         else:
             acceptor = node_copy
         return acceptor, []
@@ -1,14 +1,31 @@
-from base import OptionsBaseException
-from operator import mul
+from .base import OptionsBaseException
 from copy import deepcopy
 
+# returned by next() when product() is given an empty iterable
+_NO_ITEMS = object()
+
 
 def product(iterable):
     """
     Works like the sum function, but is multiplicative instead of
     additive.  Might be useful for factorial design of experiments.
     """
-    return reduce(mul, iterable, 1)
+    items = iter(iterable)
+    first = next(items, _NO_ITEMS)
+    if first is _NO_ITEMS:
+        return 1
+    # the first multiplication leaves the operands intact, and gives
+    # us a tree of our own that can then be multiplied in place,
+    # without copying it again at every step.  Other types are left
+    # to the ordinary operator, as their in-place counterparts may
+    # behave differently.
+    result = 1 * first
+    for item in items:
+        if isinstance(result, OptionsTreeElement):
+            result *= item
+        else:
+            result = result * item
+    return result
 
 
 def nonmutable(method):
@@ -24,6 +41,20 @@ def nonmutable(method):
     return decorator
 
 
+def attach_within_tree(element, tree):
+    """
+    Attaches tree to element as element.attach(tree) would, but the
+    depleted tree that is returned may share its nodes with the tree
+    argument.  This is for attachment within a tree, where the
+    depleted tree only serves for further attachment.  An element
+    that overrides attach is attached through its override.
+    """
+    if getattr(element.attach, 'im_func', None) is \
+       OptionsTreeElement.attach.im_func:
+        return element._attach(tree)
+    return element.attach(tree)
+
+
 class OptionsTreeElementException(OptionsBaseException):
     pass
 
@@ -71,23 +102,36 @@ class OptionsTreeElement:
     def __mul__(self, other):
         self.multiply_attach(other)
 
-    @nonmutable
     def __rmul__(self, other):
-        # this conditional stops us trying to multiply with 1 during a
-        # product() call
-        if isinstance(other, OptionsTreeElement):
-            self.multiply_attach(other)
+        if other == 1:
+            # this happens at the start of a product() call
+            return deepcopy(self)
+        return NotImplemented
+
+    def attach(self, tree):
+        """
+        Appends a copy of each root node in the tree argument (or
+        whichever elements get traversed during iteration) to a
+        corresponding leaf node in the present tree.  Returns the
+        depleted source tree.
+        """
+        # subclasses implement _attach, which is free to return a
+        # depleted tree that shares its nodes with the tree argument,
+        # so return an independent copy
+        remainder = self._attach(tree)
+        if remainder:
+            return remainder[:]
+        return remainder
 
     @nonmutable
     def __add__(self, other):
         self.attach(other)
 
-    @nonmutable
     def __radd__(self, other):
-        # this conditional stops us trying to add to 0 during a
-        # product() call
-        if isinstance(other, OptionsTreeElement):
-            self.attach(other)
+        if other == 0:
+            # this happens at the start of a sum() call
+            return deepcopy(self)
+        return NotImplemented
 
     def __imul__(self, other):
         self.multiply_attach(other)
@@ -7,7 +7,7 @@ import multiprocessing
 import subprocess
 import sys
 import errno
-from options_dict import Sequence, unlink, Check, Remove, \
+from .options_dict import Sequence, unlink, Check, Remove, \
     unpicklable, missing_dependencies
 
 try:
@@ -79,9 +79,10 @@ def pmap(functor, options_tree, message=None, nprocs_max=None,
     options_dicts = options_tree.collapse()
     nprocs = get_nprocs(len(options_dicts), nprocs_max)
 
-    # unlinking is mandatory
+    # unlinking is mandatory.  Don't append to item_hooks in-place, as
+    # it may be the caller's list.
     if unlink not in item_hooks:
-        item_hooks.append(unlink)
+        item_hooks = item_hooks + [unlink]
         
     # apply hooks
     for func in list_hooks:
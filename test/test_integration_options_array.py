@@ -106,6 +106,12 @@ class TestOptionsArrayBasics(unittest.TestCase):
         self.assertEqual(ni.get_string(collection_separator=':'),
                          'random:3.14')
 
+    def test_node_info_shares_node_names(self):
+        node_names = [el.options_dict.get_node_info().node_names
+                      for el in self.array]
+        for names in node_names[1:]:
+            self.assertIs(names, node_names[0])
+
     def test_element_types(self):
         for el in self.array:
             self.assertIsInstance(el, OptionsNode)
@@ -7,6 +7,7 @@ from opiter.options_array import OptionsArray
 from opiter.formatters import SimpleFormatter, TreeFormatter
 from copy import deepcopy
 from math import sqrt
+from pickle import dumps, loads, HIGHEST_PROTOCOL
 
 
 def bump(target_dict, key):
@@ -415,6 +416,17 @@ class TestCallableOption(unittest.TestCase):
         self.assertEqual(self.od['my_func'](1), 2)
         self.assertEqual(self.od['my_func'](1, 2), 3)
 
+    def test_pickle(self):
+        """
+        A CallableOption wrapping a module-level function can be
+        pickled and unpickled with any protocol.
+        """
+        for protocol in range(HIGHEST_PROTOCOL + 1):
+            od = loads(dumps(OptionsDict({'my_func': CallableOption(sqrt)}),
+                             protocol))
+            self.assertIsInstance(od['my_func'], CallableOption)
+            self.assertEqual(od['my_func'](4.), 2.)
+
 
     def test_check_unpicklable(self):
         """
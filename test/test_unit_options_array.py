@@ -157,6 +157,26 @@ class TestOptionsDictArrayBasics(unittest.TestCase):
         self.assertEqual(acceptor.child, array_init[0])
         self.assertEqual(len(remainder), 3)
 
+    def test_donate_copy_leaves_array_intact(self):
+        array_init = deepcopy(self.array)
+        acceptor = UnitOptionsNode('baz')
+        acceptor, remainder = self.array.donate_copy(acceptor)
+        self.assertEqual(self.array, array_init)
+        self.assertEqual(remainder, array_init[1:])
+
+    def test_attach_returns_independent_remainder(self):
+        """
+        When I attach an array to a single leaf, the depleted array
+        that is returned holds copies of the remaining nodes, with
+        their positions in the depleted array.
+        """
+        array_init = deepcopy(self.array)
+        remainder = UnitOptionsNode('baz').attach(self.array)
+        self.assertEqual(remainder, array_init[1:])
+        for node, original in zip(remainder, self.array.nodes[1:]):
+            self.assertIsNot(node, original)
+        self.assertEqual(self.array, array_init)
+
     def test_count_leaves(self):
         self.assertEqual(self.array.count_leaves(), 4)        
 
@@ -1,7 +1,8 @@
 import unittest
 from unit_options_dict import UnitOptionsDict, UnitNodeInfo, \
     OptionsDictException, NodeInfoException
-from types import MethodType
+from types import MethodType, GeneratorType
+from copy import copy, deepcopy
 
 
 def bump(target_dict, key):
@@ -20,6 +21,16 @@ class TestOptionsDictCreation(unittest.TestCase):
         """
         UnitOptionsDict({'foo': 'bar'})
 
+    def test_create_empty(self):
+        """
+        When I create OptionsDicts with no arguments, they are empty
+        and independent of each other.
+        """
+        od1 = UnitOptionsDict()
+        od2 = UnitOptionsDict()
+        od1['foo'] = 'bar'
+        self.assertEqual(len(od2), 0)
+
     def test_create_from_dependent_items(self):
         """
         When I create an OptionsDict from an iterable of functions, there
@@ -49,6 +60,16 @@ class TestOptionsDictCreation(unittest.TestCase):
             create_od = lambda: UnitOptionsDict(thing)
             self.assertRaises(OptionsDictException, create_od)
 
+    def test_create_from_iterable_with_nonfunction(self):
+        """
+        When I create an OptionsDict from an iterable that contains
+        something other than functions, an error should be raised.
+        """
+        def foo(opt):
+            return 'bar'
+        create_od = lambda: UnitOptionsDict([foo, 'baz'])
+        self.assertRaises(OptionsDictException, create_od)
+
     def test_create_with_attribute_name_clash(self):
         """
         When I create an OptionsDict and one of my items has the same
@@ -78,6 +99,25 @@ class TestOptionsDictBasics(unittest.TestCase):
     def test_unequal(self):
         self.assertNotEqual(self.od, UnitOptionsDict({'baz': 'bar'}))
 
+    def test_unequal_length(self):
+        self.assertNotEqual(self.od, UnitOptionsDict({'foo': 'bar',
+                                                      'baz': 'qux'}))
+
+    def test_unequal_node_info(self):
+        other = UnitOptionsDict({'foo': 'bar'})
+        other.set_node_info(UnitNodeInfo('foo'))
+        self.assertNotEqual(self.od, other)
+
+    def test_iterate(self):
+        """
+        Iterating over an OptionsDict yields the OptionsDict itself,
+        without creating a generator.
+        """
+        it = iter(self.od)
+        self.assertNotIsInstance(it, GeneratorType)
+        self.assertIs(next(it), self.od)
+        self.assertRaises(StopIteration, next, it)
+
     def test_node_info_empty(self):
         self.assertRaises(NodeInfoException, lambda: self.od.get_node_info())
 
@@ -105,6 +145,19 @@ class TestOptionsDictBasics(unittest.TestCase):
         od.set_node_info(ni)
         self.assertEqual(ni, od.get_node_info())
 
+    def test_deepcopy_shares_node_info(self):
+        """
+        A deep copy refers to the same node info as the original, but
+        setting new node info on the copy leaves the original alone.
+        """
+        ni = UnitNodeInfo('foo')
+        self.od.set_node_info(ni)
+        od_copy = deepcopy(self.od)
+        self.assertEqual(od_copy, self.od)
+        self.assertIs(od_copy.get_node_info(), ni)
+        od_copy.set_node_info(UnitNodeInfo('bar'))
+        self.assertIs(self.od.get_node_info(), ni)
+
     def test_compare_with_options_dict_from_class(self):
         """
         This can be done as long as there aren't any dependent items.
@@ -173,6 +226,17 @@ class TestOptionsDictDependentItems(unittest.TestCase):
         self.od['velocity'] = 0.05
         self.assertEqual(self.od['observation'], 'turbulent')
         
+    def test_dependent_item_returning_function(self):
+        """
+        I add an item whose function returns another function.  Both
+        should be evaluated.
+        """
+        def Reynolds_number_lookup(d):
+            return lambda d: d['Reynolds_number']
+        self.od.update([Reynolds_number_lookup])
+        self.od['velocity'] = 0.02
+        self.assertAlmostEqual(self.od['Reynolds_number_lookup'], 2000.)
+
     def test_independence_after_duplication(self):
         """
         Suppose I use self.od to create a new OptionsDict.  The new
@@ -191,6 +255,85 @@ class TestOptionsDictDependentItems(unittest.TestCase):
         self.assertAlmostEqual(self.od['Reynolds_number'], 0.)
 
 
+class TestOptionsDictDependentItemRecord(unittest.TestCase):
+
+    def setUp(self):
+        """
+        I create an OptionsDict with a dependent item, and change its
+        items in various ways.
+        """
+        def doubled(d):
+            return 2 * d['foo']
+        self.od = UnitOptionsDict({'foo': 1})
+        self.od.update([doubled])
+
+    def test_mutable_result_not_shared(self):
+        """
+        A dependent item returning a mutable object gives a fresh one
+        on each access.
+        """
+        def files(d):
+            return ['a']
+        self.od.update([files])
+        self.od['files'].append('b')
+        self.assertEqual(self.od['files'], ['a'])
+
+    def test_setitem_updates_dependent_item(self):
+        self.assertEqual(self.od['doubled'], 2)
+        self.od['foo'] = 2
+        self.assertEqual(self.od['doubled'], 4)
+
+    def test_update_updates_dependent_item(self):
+        self.assertEqual(self.od['doubled'], 2)
+        self.od.update({'foo': 3})
+        self.assertEqual(self.od['doubled'], 6)
+
+    def test_delitem_updates_dependent_item(self):
+        self.assertEqual(self.od['doubled'], 2)
+        del self.od['foo']
+        self.assertRaises(KeyError, lambda: self.od['doubled'])
+
+    def test_overwritten_dependent_item_is_independent(self):
+        self.assertEqual(self.od['doubled'], 2)
+        self.od['doubled'] = len
+        self.assertIs(self.od['doubled'], len)
+        self.od.update({'doubled': 5})
+        self.assertEqual(self.od['doubled'], 5)
+
+    def test_update_from_options_dict(self):
+        """
+        Dependent and independent items carry over from another
+        OptionsDict, replacing any items of the same name.
+        """
+        other = UnitOptionsDict({'foo': 4, 'doubled': 0})
+        other.update([lambda d: d['foo'] + 1])
+        self.od.update({'<lambda>': 'bar'})
+        self.od.update(other)
+        self.assertEqual(self.od['doubled'], 0)
+        self.assertEqual(self.od['<lambda>'], 5)
+
+    def test_update_from_self(self):
+        """
+        Updating an OptionsDict from itself keeps its dependent items.
+        """
+        self.od.update(self.od)
+        self.od['foo'] = 2
+        self.assertEqual(self.od['doubled'], 4)
+
+    def test_shallow_copy_independent_dependent_items(self):
+        """
+        Adding a dependent item to a shallow copy leaves the original
+        alone.
+        """
+        self.od['a'] = 1
+        def a(d):
+            return 0
+        od_copy = copy(self.od)
+        od_copy.update([a])
+        self.assertEqual(od_copy['a'], 0)
+        self.assertEqual(self.od['a'], 1)
+
+
 class TestNestedOptionsDictBasics(unittest.TestCase):
 
     def setUp(self):
@@ -251,6 +394,16 @@ class TestNestedOptionsDictDependentItems(unittest.TestCase):
         self.assertEqual(self.od['inner']['bar'], 3)
         self.assertEqual(self.od['baz'], 4)
 
+    def test_nested_dependent_item_after_evaluation(self):
+        """
+        Once the outer dependent item has been evaluated, changing the
+        inner OptionsDict still updates it.
+        """
+        self.assertEqual(self.od['baz'], 3)
+        self.od.inner.foo = 2
+        self.assertEqual(self.od['baz'], 4)
+        self.assertEqual(self.od.expand_template_string('$baz'), '4')
+
         
         
 class TestOptionsDictFromClassDependentItems(unittest.TestCase):
@@ -363,6 +516,22 @@ class TestOptionsDictTemplateExpansion(unittest.TestCase):
                          expected)
 
         
+    def test_expand_repeated_placeholder(self):
+        """
+        An item appearing several times in the template is only
+        converted to a string once.
+        """
+        conversions = []
+        class Fluid:
+            def __str__(self):
+                conversions.append(None)
+                return 'water'
+        self.od['fluid'] = Fluid()
+        template = "$fluid, ${fluid} and $fluid again."
+        self.assertEqual(self.od.expand_template_string(template, loops=2),
+                         "water, water and water again.")
+        self.assertEqual(len(conversions), 1)
+
     def test_expand_not_enough_loops(self):
         template = "$fluid has a $change point of ${${change}_point}"+\
                    " degrees C."
@@ -1,5 +1,6 @@
 import unittest
 from unit_options_node import UnitOptionsNode, OptionsNodeException
+from opiter.options_tree_elements import product
 from copy import deepcopy
 
 
@@ -48,6 +49,24 @@ class TestOptionsNodeCreation(unittest.TestCase):
                                name_format=name_format)
         self.check_name_and_items(node, '<a_node>', {'an_array': 'a_node'})
 
+    def test_create_node_with_format_function_raising_type_error(self):
+        """
+        A format function that raises a TypeError should not be
+        mistaken for a format string.
+        """
+        name_format = lambda s: s + 1
+        create_node = lambda: UnitOptionsNode('a_node',
+                                              name_format=name_format)
+        self.assertRaises(TypeError, create_node)
+
+    def test_formatted_name_is_interned(self):
+        node = UnitOptionsNode(1./7, name_format='{:.2f}')
+        self.assertIs(node.name, intern('0.14'))
+
+    def test_create_node_with_bad_format(self):
+        create_node = lambda: UnitOptionsNode('a_node', name_format=None)
+        self.assertRaises(OptionsNodeException, create_node)
+
     def test_create_node_with_bad_child(self):
         """
         When I create a node with a child that is not another
@@ -89,6 +108,39 @@ class TestOptionsNodeBasics(unittest.TestCase):
         self.assertEqual(acceptor.child, node_init)
         self.assertEqual(len(remainder), 0)        
 
+    def test_add_uses_overriding_attach(self):
+        """
+        When a node class overrides attach, adding to it, and
+        attaching through a parent, goes through the override.
+        """
+        attached = []
+        class RecordingNode(UnitOptionsNode):
+            def attach(self, tree):
+                attached.append(tree)
+                return UnitOptionsNode.attach(self, tree)
+        node = RecordingNode('baz')
+        node + self.node
+        UnitOptionsNode('qux', child=node) + self.node
+        self.assertEqual(attached, [self.node, self.node])
+
+    def test_sum_of_one_node(self):
+        result = sum([self.node])
+        self.assertEqual(result, self.node)
+        self.assertIsNot(result, self.node)
+
+    def test_product_of_one_node(self):
+        result = product([self.node])
+        self.assertEqual(result, self.node)
+        self.assertIsNot(result, self.node)
+
+    def test_add_to_nontree(self):
+        self.assertRaises(TypeError, lambda: 'foo' + self.node)
+        self.assertRaises(TypeError, lambda: 1 + self.node)
+
+    def test_multiply_nontree(self):
+        self.assertRaises(TypeError, lambda: 'foo' * self.node)
+        self.assertRaises(TypeError, lambda: 2 * self.node)
+
     def test_count_leaves(self):
         self.assertEqual(self.node.count_leaves(), 1)        
 
@@ -1,5 +1,5 @@
 import unittest
-from opiter.options_tree_elements import OptionsTreeElement
+from opiter.options_tree_elements import OptionsTreeElement, product
 
 
 class FakeOptionsDict(dict):
@@ -98,6 +98,35 @@ class TestSubOptionsTreeElement(unittest.TestCase):
         self.assertIsInstance(other, SubOptionsTreeElement)
         self.assertEqual(other.some_attr, 'bar')
         self.assertEqual(other.dict_hooks, [dict_function_2])
+
+
+
+class TestProduct(unittest.TestCase):
+
+    def test_product_of_numbers(self):
+        self.assertEqual(product([2, 3, 4]), 24)
+
+    def test_product_of_nothing(self):
+        self.assertEqual(product([]), 1)
+
+    def test_product_leaves_operands_intact(self):
+        """
+        The in-place operator is only used on trees, so an operand
+        that is its own product with 1 is not modified.
+        """
+        class Factor(object):
+            def __init__(self, value):
+                self.value = value
+            def __rmul__(self, other):
+                return self if other == 1 else NotImplemented
+            def __mul__(self, other):
+                return Factor(self.value * other)
+            def __imul__(self, other):
+                self.value *= other
+                return self
+        first = Factor(2)
+        self.assertEqual(product([first, 3, 4]).value, 24)
+        self.assertEqual(first.value, 2)
         
         
 if __name__ == '__main__':
@@ -22,7 +22,7 @@ class UnitOptionsNode(OptionsNode):
     This is OptionsNode decoupled from the OptionsDict and
     OrphanNodeInfo implementations for unit testing purposes.
     """
-    def create_options_dict(self, items={}):
+    def create_options_dict(self, items=None):
         """
         Throwaway implementation.  Don't expect it to do anything with
         the passed in items.